@@ -5,11 +5,16 @@ from utils import load_symbols, get_yahoo_tickers, fetch_data, get_fresh_52week
 st.set_page_config(page_title="NSE 52-Week High Screener")
 st.title("🕵️ NSE 52-Week High Screener")
 
-@st.cache
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
 def init_tickers():
     symbols = load_symbols()
     return get_yahoo_tickers(symbols)
 
+@st.cache_data(ttl=15 * 60, show_spinner=False)
+def load_price_history(tickers: tuple[str, ...]):
+    # the 52-week scan only reads High and Close
+    return fetch_data(tickers, columns=("High", "Close"))
+
 all_tickers = init_tickers()
 
 selected = st.multiselect(
@@ -21,7 +26,7 @@ to_scan = selected or all_tickers
 
 if st.button("Run Screener"):
     with st.spinner("Scanning… this may take a minute"):
-        data = fetch_data(to_scan)
+        data = load_price_history(tuple(sorted(set(to_scan))))
         fresh = get_fresh_52week(data)
 
     if fresh:
@@ -134,16 +134,22 @@
 
 
 #!/usr/bin/env python3
+import sys
 import time
 import schedule
 import logging
+import threading
+import warnings
 from datetime import datetime
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 
+import numpy as np
 import yfinance as yf
 import pandas as pd
 
-from utils import load_sector_symbols, load_thematic_symbols, chunk_list
+from utils import YF_SESSION, load_symbols, chunk_list
 
 # ─── CONFIG ────────────────────────────────────────────────────────────────
 VOL_THRESH       = 2.5
@@ -153,7 +159,13 @@ BREAKOUT_PERIODS = [50, 100, 200, 365]
 TIMEOUT          = 20          # seconds for HTTP requests
 RETRIES          = 3           # number of retry attempts for downloads
 MAX_FAILURES     = 3           # max failures per symbol before skipping
+CHUNK_SIZE       = 50          # symbols per yf.download request
+DOWNLOAD_WORKERS = 4           # concurrent chunk downloads
 LOG_FILE         = "screener.log"
+EXCHANGE_TZ      = "Asia/Kolkata"  # NSE session dates, whatever the host's zone
+OHLCV_FIELDS     = ("Open", "High", "Low", "Close", "Volume")
+BOOST_FMT        = "  🚀 %-10s | spike=%4.2f× | stockΔ=%5.2f%% | R=%4.2f"
+BREAKOUT_FMT     = "  %-10s | %4s | sgn%%=%5.2f%% | Δ=%5.2f%% | @ %s"
 
 # ─── SETUP LOGGING ─────────────────────────────────────────────────────────
 logging.basicConfig(
@@ -164,26 +176,43 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # ─── LOAD UNIVERSE ─────────────────────────────────────────────────────────
-sectors = load_sector_symbols()
-try:
-    sectors["Railways PSU"] = load_thematic_symbols("Nifty India Railways PSU")
-except Exception as e:
-    logger.warning(f"Failed loading thematic symbols: {e}")
+def _build_universe():
+    """Sorted Yahoo tickers for every sector and thematic basket.
 
-SYMBOLS = sorted({s for tickers in sectors.values() for s in tickers})
+    ``load_symbols`` keeps the resolved universe in its on-disk manifest, so
+    restarts and repeated scans skip the NSE CSV downloads entirely.
+    """
+    return sorted({s for tickers in load_symbols().values() for s in tickers})
+
+SYMBOLS = _build_universe()
 SKIP_SYMBOLS = set()
 FAILURE_COUNTS = defaultdict(int)
+_FAILURE_LOCK = threading.Lock()   # downloads run on worker threads
 
 # ─── DOWNLOAD WITH RETRIES ──────────────────────────────────────────────────
 def download_with_retry(symbols, **kwargs):
+    """Download ``symbols`` in ``CHUNK_SIZE`` batches fetched concurrently.
+
+    Each batch is retried on its own, so one bad batch only costs its own
+    symbols a failure; the surviving batches are stitched back together.
+    """
+    chunks = list(chunk_list(symbols, CHUNK_SIZE))
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as ex:
+        parts = list(ex.map(lambda chunk: _download_chunk(chunk, **kwargs), chunks))
+    parts = [part for part in parts if not part.empty]
+    return pd.concat(parts, axis=1) if parts else pd.DataFrame()
+
+def _download_chunk(symbols, **kwargs):
     for attempt in range(1, RETRIES + 1):
         try:
             data = yf.download(
                 symbols,
                 **kwargs,
+                threads=True,
                 timeout=TIMEOUT,
                 progress=False,
-                auto_adjust=False
+                auto_adjust=False,
+                session=YF_SESSION,
             )
             return data
         except Exception as e:
@@ -191,109 +220,206 @@ def download_with_retry(symbols, **kwargs):
             time.sleep(2 * attempt)
     # After retries, register failures per symbol
     if isinstance(symbols, list):
-        for sym in symbols:
-            FAILURE_COUNTS[sym] += 1
-            if FAILURE_COUNTS[sym] >= MAX_FAILURES:
-                SKIP_SYMBOLS.add(sym)
-                logger.error(f"Skipping {sym} after {MAX_FAILURES} failures")
+        with _FAILURE_LOCK:
+            for sym in symbols:
+                FAILURE_COUNTS[sym] += 1
+                if FAILURE_COUNTS[sym] >= MAX_FAILURES:
+                    SKIP_SYMBOLS.add(sym)
+                    logger.error(f"Skipping {sym} after {MAX_FAILURES} failures")
     return pd.DataFrame()
 
+# ─── DAILY HISTORY CACHE ────────────────────────────────────────────────────
+_daily_cache = {"symbols": frozenset(), "frame": pd.DataFrame()}
+
+def download_daily(symbols, period):
+    """Daily bars for ``symbols``, downloaded at most once per session.
+
+    Breakouts only read the bars *before* today, which do not change
+    intraday, so a frame that already holds today's bar is reused by every
+    later scan.  A new session, or symbols missing from the cached frame,
+    trigger a fresh download.
+    """
+    cached = _daily_cache["frame"]
+    if (
+        not cached.empty
+        and _is_exchange_today(cached.index[-1])
+        and _daily_cache["symbols"].issuperset(symbols)
+    ):
+        return cached
+
+    daily = download_with_retry(symbols, period=period, interval="1d", group_by='ticker')
+    if not daily.empty:
+        # Record what the frame really holds: a chunk that exhausted its
+        # retries is dropped, and those symbols must be fetched again.
+        _daily_cache.update(symbols=frozenset(daily.columns.get_level_values(0)), frame=daily)
+    return daily
+
+def _is_exchange_today(bar):
+    """Whether daily ``bar`` is today's session on the exchange calendar.
+
+    Naive daily stamps are already exchange dates; aware ones are compared
+    in their own zone.
+    """
+    return bar.date() == pd.Timestamp.now(tz=bar.tz or EXCHANGE_TZ).date()
+
+# ─── COLUMNAR LAYOUT ────────────────────────────────────────────────────────
+def _field_arrays(frame, symbols):
+    """Reshape a ticker-first OHLCV frame into one ``(T, N)`` array per field.
+
+    Columns follow ``symbols`` order; tickers missing from ``frame`` are all
+    NaN.  Returns ``None`` when there is nothing to reshape.
+    """
+    if frame.empty or not isinstance(frame.columns, pd.MultiIndex):
+        return None
+    # Resolve every (ticker, field) column position in one index lookup and
+    # gather from a single ndarray, instead of an xs + reindex per field.
+    # Missing pairs (-1) land on a trailing all-NaN column.
+    wanted = pd.MultiIndex.from_product([symbols, OHLCV_FIELDS])
+    positions = frame.columns.get_indexer(wanted).reshape(len(symbols), len(OHLCV_FIELDS)).T
+    values = np.append(frame.to_numpy(dtype=float), np.full((len(frame), 1), np.nan), axis=1)
+    return {field: values[:, positions[k]] for k, field in enumerate(OHLCV_FIELDS)}
+
+def _nonzero(values):
+    """``values`` with zeros replaced by NaN, for use as a safe denominator."""
+    return np.where(values != 0, values, np.nan)
+
+def _prior_extremes(daily_np, periods):
+    """Map each lookback ``n`` to NaN-skipping (high, low) over the ``n`` bars before today.
+
+    The windows all end at the previous bar and are nested, so each longer
+    window only reduces the rows the shorter one did not already cover.
+    """
+    history_high, history_low = daily_np["High"][:-1], daily_np["Low"][:-1]
+    length = end = len(history_high)
+    run_high = run_low = np.full(history_high.shape[1], np.nan)
+    extremes = {}
+    with warnings.catch_warnings():
+        # symbols with no bars in a block yield NaN ("All-NaN slice")
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        for n in sorted(periods):
+            start = max(length - n, 0)
+            if start < end:
+                run_high = np.fmax(run_high, np.nanmax(history_high[start:end], axis=0))
+                run_low = np.fmin(run_low, np.nanmin(history_low[start:end], axis=0))
+                end = start
+            extremes[n] = run_high, run_low
+    return extremes
+
+# ─── OUTPUT ─────────────────────────────────────────────────────────────────
+def _print_and_log(header, messages):
+    """Emit one report section with a single stdout write and log record.
+
+    Sections without any ``messages`` only print their header.
+    """
+    sys.stdout.write("\n".join([header, *messages]) + "\n")
+    if messages:
+        logger.info("\n".join([header.strip(), *messages]))
+
 # ─── FULL BATCHED SCAN ──────────────────────────────────────────────────────
 def scan_all():
     now = datetime.now().strftime("%Y-%m-%d %H:%M")
     print(f"\n[{now}] 🔎 Starting full scan…")
 
+    # refresh the universe (a cheap manifest read until it expires)
+    global SYMBOLS
+    SYMBOLS = _build_universe()
+
     # filter out skipped symbols
     active_symbols = [s for s in SYMBOLS if s not in SKIP_SYMBOLS]
     if not active_symbols:
         print("No active symbols to scan.")
         return
 
-    # 1) Intraday data
-    intr = download_with_retry(
-        active_symbols + ["^NSEI"],
-        period=PERIOD_INTR_DAY,
-        interval=INTERVAL,
-        group_by='ticker'
-    )
-
-    # 2) Daily data for breakouts
+    # 1) Intraday data and 2) daily data for breakouts are independent
+    # fan-outs, so run them side by side instead of back to back.
     max_n = max(BREAKOUT_PERIODS)
-    daily = download_with_retry(
-        active_symbols,
-        period=f"{max_n + 1}d",
-        interval="1d"
-    )
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        f_intr = ex.submit(
+            download_with_retry,
+            active_symbols + ["^NSEI"],
+            period=PERIOD_INTR_DAY,
+            interval=INTERVAL,
+            group_by='ticker'
+        )
+        f_daily = ex.submit(download_daily, active_symbols, period=f"{max_n + 1}d")
+        intr, daily = f_intr.result(), f_daily.result()
+
+    # Column i of every (T, N) array below belongs to active_symbols[i].
+    intr_np = _field_arrays(intr, active_symbols)
+    daily_np = _field_arrays(daily, active_symbols)
 
     # — Intraday Boost —
-    print(f"\n[{now}] 🔎 Intraday Boost:")
+    messages = []
     if "^NSEI" not in intr or len(intr["^NSEI"]) < 2:
-        print("  no index data yet")
+        messages.append("  no index data yet")
     else:
         idx_df = intr["^NSEI"]
         idx_open, idx_close = idx_df["Open"].iloc[0], idx_df["Close"].iloc[-1]
         idx_move = (idx_close - idx_open) / idx_open or 1e-6
 
-        for sym in active_symbols:
-            if sym in _seen_intraday:
-                continue
-            if sym not in intr or len(intr[sym]) < 2:
-                continue
-
-            df = intr[sym]
-            vol_open, vol_last = df["Volume"].iloc[0], df["Volume"].iloc[-1]
-            spike = vol_last / max(vol_open, 1.0)
-            if spike < VOL_THRESH:
-                continue
-
-            first_open, last_close = df["Open"].iloc[0], df["Close"].iloc[-1]
-            stock_move = (last_close - first_open) / first_open
-            r_factor = stock_move / idx_move
-            move_pct = stock_move * 100
-
-            print(
-                f"  🚀 {sym:10} | spike={spike:4.2f}× | stockΔ={move_pct:5.2f}% | R={r_factor:4.2f}"
-            )
-            _seen_intraday.add(sym)
+        # Gate on the volume spike first; price moves are only computed for
+        # the (usually few) unseen symbols that clear VOL_THRESH.
+        volumes = intr_np["Volume"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            spike = volumes[-1] / np.maximum(volumes[0], 1.0)
+        # not ``>=``: like the per-symbol ``spike < VOL_THRESH`` skip, a NaN
+        # spike (missing first/last bar volume) is still reported; tickers
+        # absent from the download are not
+        hot = np.flatnonzero(~(spike < VOL_THRESH))
+        hot = hot[[(sym := active_symbols[i]) in intr and sym not in _seen_intraday for i in hot]]
+
+        first_open = _nonzero(intr_np["Open"][0, hot])
+        stock_move = (intr_np["Close"][-1, hot] - first_open) / first_open
+        r_factor = stock_move / idx_move
+
+        hot_symbols = [active_symbols[i] for i in hot]
+        rows = zip(hot_symbols, spike[hot].tolist(), (stock_move * 100).tolist(), r_factor.tolist())
+        messages.extend(BOOST_FMT % row for row in rows)
+        _seen_intraday.update(hot_symbols)
+    _print_and_log(f"\n[{now}] 🔎 Intraday Boost:", messages)
 
     # — Breakout Beacons —
+    # Today's bar for every ticker, pulled once and shared by all lookbacks.
+    if intr_np is not None:
+        high_last, low_last = intr_np["High"][-1], intr_np["Low"][-1]
+        open_last, close_last = intr_np["Open"][-1], intr_np["Close"][-1]
+        pct = (close_last - open_last) / _nonzero(open_last) * 100
+        # all tickers share the intraday time axis of the batched download
+        latest_ts = intr.index[-1].strftime("%H:%M")
+    if daily_np is not None:
+        extremes = _prior_extremes(daily_np, BREAKOUT_PERIODS)
+
     for n in BREAKOUT_PERIODS:
-        print(f"\n[{now}] 🔎 {n}-Day Breakout Beacon:")
-        if daily.empty or 'High' not in daily:
-            print("  no daily data")
+        header = f"\n[{now}] 🔎 {n}-Day Breakout Beacon:"
+        if daily_np is None:
+            _print_and_log(header, ["  no daily data"])
+            continue
+        if intr_np is None:
+            _print_and_log(header, [])
             continue
 
-        slice_n = daily.iloc[-(n+1):-1]
-        highs = slice_n["High"].max() if isinstance(highs := slice_n["High"], pd.DataFrame) else pd.Series()
-        lows = slice_n["Low"].min() if isinstance(lows := slice_n["Low"], pd.DataFrame) else pd.Series()
-
-        for sym in active_symbols:
-            if sym in _seen_breakouts[n]:
-                continue
-            if sym not in intr or intr[sym].empty:
-                continue
-
-            ts = intr[sym].index[-1].strftime("%H:%M")
-            hb, lb, ob, cb = (
-                intr[sym]["High"].iloc[-1],
-                intr[sym]["Low"].iloc[-1],
-                intr[sym]["Open"].iloc[-1],
-                intr[sym]["Close"].iloc[-1]
-            )
-
-            if sym not in highs or pd.isna(highs[sym]):
-                continue
-
-            if hb > highs[sym]:
-                dir_, sgn = "bull", (cb - highs[sym]) / highs[sym] * 100
-            elif lb < lows[sym]:
-                dir_, sgn = "bear", (cb - lows[sym]) / lows[sym] * 100
-            else:
-                continue
-
-            pct = (cb - ob) / ob * 100
-            print(f"  {sym:10} | {dir_:>4} | sgn%={sgn:5.2f}% | Δ={pct:5.2f}% | @ {ts}")
-            _seen_breakouts[n].add(sym)
+        # One validity mask per lookback replaces the per-symbol NaN checks;
+        # the signed move is then only computed for the surviving columns.
+        prior_high, prior_low = extremes[n]
+        valid = ~np.isnan(prior_high)
+        bull = valid & (high_last > prior_high)
+        bear = valid & ~bull & (low_last < prior_low)
+        hits = [i for i in np.flatnonzero(bull | bear) if active_symbols[i] not in _seen_breakouts[n]]
+
+        hit_bull = bull[hits]
+        level = _nonzero(np.where(hit_bull, prior_high[hits], prior_low[hits]))
+        sgn_pct = (close_last[hits] - level) / level * 100
+
+        hit_symbols = [active_symbols[i] for i in hits]
+        rows = zip(
+            hit_symbols,
+            np.where(hit_bull, "bull", "bear").tolist(),
+            sgn_pct.tolist(),
+            pct[hits].tolist(),
+            repeat(latest_ts),
+        )
+        _print_and_log(header, [BREAKOUT_FMT % row for row in rows])
+        _seen_breakouts[n].update(hit_symbols)
 
 # ─── STATE for de-duplication ───────────────────────────────────────────────
 _seen_intraday = set()
@@ -305,8 +431,10 @@ def main():
     schedule.every(5).minutes.do(scan_all)
     print(f"\n🔄 Scheduled full scan every 5 minutes.")
     while True:
+        # sleep until the next job is due instead of polling every second
+        idle = schedule.idle_seconds()
+        time.sleep(max(1, idle) if idle is not None else 60)
         schedule.run_pending()
-        time.sleep(1)
 
 if __name__ == "__main__":
     main()
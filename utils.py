@@ -1,12 +1,30 @@
 #!/usr/bin/env python3
+import asyncio
+import hashlib
+import importlib.util
+import json
 import logging
+import os
+import tempfile
+import time
 from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from io import StringIO
+from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import requests
 import yfinance as yf
-from urllib.error import HTTPError
+from curl_cffi import requests as curl_requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # optional: JIT-compiled fresh-high kernel for large universes
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - numba is not a hard dependency
+    njit = None
 
 # ─── Sector Constellations ──────────────────────────────────────────────────
 SECTOR_URLS = {
@@ -36,45 +54,350 @@ THEMATIC_URLS = {
 
 LOGGER = logging.getLogger(__name__)
 DEFAULT_LOOKBACK_DAYS = 380
-DEFAULT_CHUNK_SIZE = 25
+DEFAULT_CHUNK_SIZE = 20                # Yahoo's multi-symbol endpoint takes ~20 tickers
+DOWNLOAD_WORKERS = 4                   # concurrent Yahoo batch downloads
+PRICE_COLUMNS = ("Open", "High", "Low", "Close", "Adj Close", "Volume")
+HTTP_TIMEOUT = 10                      # seconds for NSE CSV requests
+CSV_CACHE_TTL = 24 * 60 * 60           # NSE republishes constituent lists at most daily
+FETCH_WORKERS = 8                      # concurrent NSE CSV downloads
+CACHE_DIR = Path.home() / ".cache" / "nse_screener"
+PRICE_CACHE_DIR = CACHE_DIR / "ohlcv"  # per-ticker daily history (needs pyarrow)
+INCREMENTAL_DAYS = 5                   # bars re-downloaded on top of a cached history
+PARQUET_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+# One pooled session for every NSE / Nifty Indices request so TCP+TLS
+# connections are reused across the sector and thematic CSVs.
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "Mozilla/5.0", "Connection": "keep-alive"})
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            raise_on_status=False,  # surface the last response via raise_for_status
+        ),
+    ),
+)
+
+# yf.download builds a new session per call unless one is passed, and swaps it
+# into yfinance's shared YfData singleton; concurrent batches would then drop
+# keep-alive and clobber each other's cookie/crumb.  Every download passes this
+# one impersonating session instead (yfinance rejects caching sessions).
+YF_SESSION = curl_requests.Session(impersonate="chrome")
+
+
+def _cache_path(url: str) -> Path:
+    return CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.csv"
+
+
+def _read_cache(path: Path, ttl: float | None = None) -> str | None:
+    """Cached body at ``path`` if younger than ``ttl`` seconds (any age when ``None``)."""
+
+    try:
+        if ttl is None or time.time() - path.stat().st_mtime < ttl:
+            return path.read_text(encoding="utf-8")
+    except OSError:
+        pass
+    return None
+
+
+def _write_cache(path: Path, text: str, headers: Mapping[str, str]) -> None:
+    """Store ``text`` at ``path`` plus the response's ETag/Last-Modified validators."""
+
+    validators = {key: headers[key] for key in ("ETag", "Last-Modified") if key in headers}
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(text, encoding="utf-8")
+        tmp.replace(path)
+        path.with_suffix(".json").write_text(json.dumps(validators), encoding="utf-8")
+    except OSError as exc:  # pragma: no cover - read-only home, full disk, ...
+        LOGGER.warning("Could not cache %s: %s", path, exc)
+
+
+def _conditional_headers(path: Path) -> dict[str, str]:
+    """``If-None-Match``/``If-Modified-Since`` headers for revalidating ``path``."""
+
+    try:
+        if not path.exists():
+            return {}
+        validators = json.loads(path.with_suffix(".json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    headers = {}
+    if "ETag" in validators:
+        headers["If-None-Match"] = validators["ETag"]
+    if "Last-Modified" in validators:
+        headers["If-Modified-Since"] = validators["Last-Modified"]
+    return headers
+
+
+def _revalidated(path: Path) -> str | None:
+    """Handle a ``304 Not Modified``: restart the TTL and return the cached body."""
+
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return _read_cache(path)
+
+
+def _get_cached_csv(url: str, ttl: int = CSV_CACHE_TTL) -> str:
+    """Return the body of ``url``, served from the on-disk cache while fresh.
+
+    Responses are stored under :data:`CACHE_DIR` keyed by a hash of the URL.
+    A cache file younger than ``ttl`` seconds is returned without touching the
+    network; otherwise the CSV is requested through the shared session,
+    conditionally on the stored ETag/Last-Modified so an unchanged file costs
+    a ``304`` instead of a full download, and written back.
+
+    If the download fails but an expired copy exists, the stale copy is
+    served instead; without one, the error propagates (HTTP errors as
+    :class:`requests.HTTPError`).  A ``404`` always propagates, so a withdrawn
+    CSV is skipped rather than served stale forever.
+    """
+
+    path = _cache_path(url)
+    if (text := _read_cache(path, ttl)) is not None:
+        return text
+
+    try:
+        resp = _SESSION.get(url, headers=_conditional_headers(path), timeout=HTTP_TIMEOUT)
+        resp.raise_for_status()
+    except requests.RequestException as exc:
+        # A withdrawn CSV (404) must surface so the caller can skip it.
+        if _is_not_found(exc) or (stale := _read_cache(path)) is None:
+            raise
+        LOGGER.warning("Serving stale cache for %s: %s", url, exc)
+        return stale
+    if resp.status_code == 304 and (text := _revalidated(path)) is not None:
+        return text
+    _write_cache(path, resp.text, resp.headers)
+    return resp.text
+
+
+async def _get_cached_csv_async(client, url: str, ttl: int = CSV_CACHE_TTL) -> str:
+    """:func:`_get_cached_csv` over an ``httpx.AsyncClient``."""
+
+    import httpx
+
+    path = _cache_path(url)
+    if (text := _read_cache(path, ttl)) is not None:
+        return text
+
+    try:
+        resp = await client.get(url, headers=_conditional_headers(path))
+        if resp.status_code != 304:  # httpx treats every non-2xx as an error
+            resp.raise_for_status()
+    except httpx.HTTPError as exc:
+        if _is_not_found(exc) or (stale := _read_cache(path)) is None:
+            raise
+        LOGGER.warning("Serving stale cache for %s: %s", url, exc)
+        return stale
+    if resp.status_code == 304 and (cached := _revalidated(path)) is not None:
+        return cached
+    _write_cache(path, resp.text, resp.headers)
+    return resp.text
+
+
+def _is_not_found(exc: Exception) -> bool:
+    """Whether ``exc`` carries an HTTP 404 response (requests or httpx)."""
+
+    return getattr(getattr(exc, "response", None), "status_code", None) == 404
+
+
+def _is_symbol_column(name: str) -> bool:
+    """``usecols`` filter so the CSV parser only materialises the SYMBOL column."""
+
+    return name.strip().upper() == "SYMBOL"
+
+
+def _ttl_bucket() -> int:
+    """Index of the current :data:`CSV_CACHE_TTL` window.
+
+    Passed to the memoised loaders so their in-process cache rolls over on
+    the same schedule as the on-disk CSV cache.
+    """
+
+    return int(time.time() // CSV_CACHE_TTL)
+
 
 def load_sector_symbols() -> dict[str, list[str]]:
-    sectors = {}
-    for sector, url in SECTOR_URLS.items():
-        try:
-            df = pd.read_csv(url)
-        except HTTPError as e:
-            if getattr(e, "code", None) == 404:
-                continue
-            print(f"⚠️ Could not load {sector}: {e}")
-            continue
-        except Exception as e:
-            print(f"⚠️ Could not load {sector}: {e}")
-            continue
+    """Return ``{sector: [yahoo tickers]}`` for every configured sector.
 
-        df.columns = df.columns.str.strip().str.upper()
-        if "SYMBOL" not in df.columns:
-            print(f"❌ No SYMBOL column for {sector}: {df.columns.tolist()}")
-            continue
+    Sectors that loaded are memoised per process; any that failed are retried
+    on the next call.  Each call gets fresh containers so callers are free to
+    mutate them.
+    """
+
+    return {sector: list(symbols) for sector, symbols in _load_sector_symbols(_ttl_bucket()).items()}
+
+
+def _fetch_sector(sector: str, url: str) -> tuple[str, tuple[str, ...] | None] | None:
+    """Download and parse one sector CSV.
+
+    Returns ``(sector, None)`` when NSE no longer publishes the CSV (404), and
+    ``None`` when it cannot be used right now and is worth retrying.
+    """
 
-        sectors[sector] = [sym + ".NS" for sym in df["SYMBOL"].tolist()]
+    try:
+        text = _get_cached_csv(url)
+    except requests.HTTPError as e:
+        if getattr(e.response, "status_code", None) == 404:
+            return sector, None
+        LOGGER.warning("Could not load %s: %s", sector, e)
+        return None
+    except Exception as e:
+        LOGGER.warning("Could not load %s: %s", sector, e)
+        return None
+    return _parse_sector(sector, text)
+
+
+def _parse_sector(sector: str, text: str) -> tuple[str, tuple[str, ...]] | None:
+    try:
+        symbols = _read_symbols(text)
+    except Exception as e:
+        LOGGER.warning("Could not load %s: %s", sector, e)
+        return None
+
+    if symbols is None:
+        LOGGER.error("No SYMBOL column for %s", sector)
+        return None
+
+    return sector, symbols
+
+
+def _read_symbols(text: str) -> tuple[str, ...] | None:
+    """Yahoo tickers listed in a constituent CSV, or ``None`` without a SYMBOL column.
+
+    Only the SYMBOL column is tokenised, as strings with no type inference;
+    blank cells are dropped.
+    """
+
+    df = pd.read_csv(StringIO(text), usecols=_is_symbol_column, engine="c", dtype="string")
+    if df.columns.empty:
+        return None
+    symbols = df.iloc[:, 0].str.strip().dropna()
+    return tuple((symbols[symbols != ""] + ".NS").tolist())
+
+
+# sector -> (ttl bucket, symbols); only settled outcomes are remembered, with
+# ``None`` for a CSV that returned 404.
+_SECTOR_MEMO: dict[str, tuple[int, tuple[str, ...] | None]] = {}
+
+
+def _load_sector_symbols(ttl_bucket: int) -> dict[str, tuple[str, ...]]:
+    # Sectors that failed transiently (or were never loaded in this bucket) are
+    # retried on every call, so one error cannot hide a sector for the whole
+    # TTL; a withdrawn (404) CSV is settled and not re-requested until then.
+    missing = {
+        sector: url
+        for sector, url in SECTOR_URLS.items()
+        if _SECTOR_MEMO.get(sector, (None,))[0] != ttl_bucket
+    }
+    if missing:
+        # The CSV downloads are independent and I/O bound, so fetch them
+        # concurrently; total latency becomes the slowest request, not the sum.
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as ex:
+            futures = [ex.submit(_fetch_sector, sector, url) for sector, url in missing.items()]
+            for future in as_completed(futures):
+                if (result := future.result()) is not None:
+                    sector, symbols = result
+                    _SECTOR_MEMO[sector] = (ttl_bucket, symbols)
+    # Completion order is arbitrary; keep the configured sector order.
+    loaded = {}
+    for sector in SECTOR_URLS:
+        bucket, symbols = _SECTOR_MEMO.get(sector, (None, None))
+        if bucket == ttl_bucket and symbols is not None:
+            loaded[sector] = symbols
+    return loaded
+
+
+def _withdrawn_sectors(ttl_bucket: int) -> set[str]:
+    """Sectors whose CSV returned 404 in this TTL bucket."""
+
+    return {
+        sector
+        for sector, (bucket, symbols) in _SECTOR_MEMO.items()
+        if bucket == ttl_bucket and symbols is None
+    }
+
+
+async def load_sector_symbols_async() -> dict[str, list[str]]:
+    """Event-loop counterpart of :func:`load_sector_symbols`.
+
+    All sector CSVs are requested at once through one ``httpx`` client over
+    HTTP/2, so the requests to each host are multiplexed on a single
+    connection, sharing the same on-disk cache and parsing as the threaded
+    loader.  Intended for callers that already run an event loop; requires
+    the optional ``httpx[http2]`` package.
+    """
+
+    import httpx
+
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=3,  # connection failures only; HTTP errors fall back to the cache
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+    )
+    async with httpx.AsyncClient(
+        transport=transport,
+        headers={"User-Agent": "Mozilla/5.0"},
+        timeout=HTTP_TIMEOUT,
+    ) as client:
+        texts = await asyncio.gather(
+            *(_get_cached_csv_async(client, url) for url in SECTOR_URLS.values()),
+            return_exceptions=True,
+        )
+
+    sectors = {}
+    for sector, text in zip(SECTOR_URLS, texts):
+        if isinstance(text, BaseException):
+            if not _is_not_found(text):
+                LOGGER.warning("Could not load %s: %s", sector, text)
+            continue
+        if (result := _parse_sector(sector, text)) is not None:
+            sectors[sector] = list(result[1])
     return sectors
 
+
 def load_thematic_symbols(name: str) -> list[str]:
-    if name not in THEMATIC_URLS:
-        raise ValueError(f"No CSV URL configured for thematic '{name}'")
-    resp = requests.get(THEMATIC_URLS[name], headers={"User-Agent": "Mozilla/5.0"})
-    resp.raise_for_status()
-    df = pd.read_csv(StringIO(resp.text))
-    df.columns = df.columns.str.strip().str.upper()
-    if "SYMBOL" not in df.columns:
-        raise RuntimeError(f"CSV for {name} has no SYMBOL column: {df.columns.tolist()}")
-    return [sym + ".NS" for sym in df["SYMBOL"].tolist()]
+    if (symbols := _load_thematic_symbols(name, _ttl_bucket())) is None:
+        raise LookupError(f"CSV for {name} is no longer published")
+    return list(symbols)
 
 
-def load_symbols(include_thematics: bool = True) -> dict[str, list[str]]:
+@lru_cache(maxsize=8)
+def _load_thematic_symbols(name: str, ttl_bucket: int) -> tuple[str, ...] | None:
+    # Transient failures raise (and are retried); a 404 is memoised as None.
+    if name not in THEMATIC_URLS:
+        raise ValueError(f"No CSV URL configured for thematic '{name}'")
+    try:
+        text = _get_cached_csv(THEMATIC_URLS[name])
+    except requests.HTTPError as exc:
+        if _is_not_found(exc):
+            return None
+        raise
+    symbols = _read_symbols(text)
+    if symbols is None:
+        raise RuntimeError(f"CSV for {name} has no SYMBOL column")
+    return symbols
+
+
+def load_symbols(include_thematics: bool = True, *, force_refresh: bool = False) -> dict[str, list[str]]:
     """Return the NSE universes configured for the screener.
 
+    Once every universe has loaded, the result is kept in a JSON manifest
+    under :data:`CACHE_DIR` and returned from there for
+    :data:`CSV_CACHE_TTL` seconds, so a warm start makes no HTTP requests and
+    parses no CSVs.  Universes whose CSV is no longer published (404) count
+    as settled; results missing anything else are returned but never
+    persisted.
+
     Parameters
     ----------
     include_thematics:
@@ -82,17 +405,41 @@ def load_symbols(include_thematics: bool = True) -> dict[str, list[str]]:
         universes with any extra thematic baskets declared in
         :data:`THEMATIC_URLS`.  Failures are logged and ignored so the caller
         still receives the sector symbols.
+    force_refresh:
+        Ignore the manifest and rebuild it from the constituent CSVs.
     """
 
-    universes = load_sector_symbols()
-    if not include_thematics:
-        return universes
+    manifest = CACHE_DIR / ("symbols.json" if include_thematics else "symbols_sectors.json")
+    if not force_refresh:
+        try:
+            if time.time() - manifest.stat().st_mtime < CSV_CACHE_TTL:
+                return json.loads(manifest.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            pass
 
-    for name in THEMATIC_URLS:
+    universes = load_sector_symbols()
+    withdrawn = _withdrawn_sectors(_ttl_bucket())
+    if include_thematics:
+        for name in THEMATIC_URLS:
+            try:
+                universes[name] = load_thematic_symbols(name)
+            except LookupError as exc:
+                withdrawn.add(name)
+                LOGGER.warning("Unable to load thematic '%s': %s", name, exc)
+            except Exception as exc:  # pragma: no cover - network/HTTP variations
+                LOGGER.warning("Unable to load thematic '%s': %s", name, exc)
+
+    # Only persist a settled universe: a sector or thematic that failed
+    # transiently must be retried on the next call, not hidden for the TTL.
+    expected = [*SECTOR_URLS, *(THEMATIC_URLS if include_thematics else ())]
+    if all(name in universes or name in withdrawn for name in expected):
         try:
-            universes[name] = load_thematic_symbols(name)
-        except Exception as exc:  # pragma: no cover - network/HTTP variations
-            LOGGER.warning("Unable to load thematic '%s': %s", name, exc)
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = manifest.with_suffix(".tmp")
+            tmp.write_text(json.dumps(universes), encoding="utf-8")
+            tmp.replace(manifest)
+        except OSError as exc:  # pragma: no cover - read-only home, full disk, ...
+            LOGGER.warning("Could not cache %s: %s", manifest, exc)
     return universes
 
 
@@ -104,16 +451,9 @@ def get_yahoo_tickers(universe: Mapping[str, Iterable[str]] | Iterable[str]) ->
     else:
         iterable = universe
 
-    seen: dict[str, None] = {}
-    for symbol in iterable:
-        if not symbol:
-            continue
-        sym = symbol.strip()
-        if not sym:
-            continue
-        # ``dict.fromkeys`` preserves insertion order (Python 3.7+)
-        seen.setdefault(sym, None)
-    return sorted(seen.keys())
+    # Strip once per symbol and drop blanks in the same pass; the output is
+    # sorted anyway, so a plain set is enough to de-duplicate.
+    return sorted({sym for symbol in iterable if symbol and (sym := symbol.strip())})
 
 
 def fetch_data(
@@ -122,57 +462,257 @@ def fetch_data(
     lookback_days: int = DEFAULT_LOOKBACK_DAYS,
     interval: str = "1d",
     chunk_size: int = DEFAULT_CHUNK_SIZE,
+    columns: Iterable[str] = PRICE_COLUMNS,
 ) -> dict[str, pd.DataFrame]:
     """Download historical data for the supplied tickers.
 
     The helper batches requests to Yahoo Finance to avoid excessive query
-    strings for very large universes.  Any batch download failures are logged
-    and skipped so that partial results are still returned to the caller.
+    strings for very large universes, downloading up to
+    :data:`DOWNLOAD_WORKERS` batches concurrently.  Any batch download failures
+    are logged and skipped so that partial results are still returned to the
+    caller.
+
+    Only the requested ``columns`` are kept per ticker (those Yahoo did not
+    return are skipped); scans that read just ``High``/``Close`` can pass
+    those to cut resident memory roughly threefold.
+
+    Prices stay ``float64``: the 52-week test's ``1e-6`` tolerance is close
+    to ``float32`` rounding, and ``float32`` cannot hold paise for stocks
+    priced above roughly ₹1.3 lakh (e.g. MRF).
+
+    Daily histories are also cached per ticker as Parquet under
+    :data:`PRICE_CACHE_DIR` when ``pyarrow`` is installed.  A cached ticker
+    whose last bar is at most :data:`INCREMENTAL_DAYS` old only has its
+    latest bars downloaded and merged in, unless those bars disagree with the
+    cache (a split or dividend re-adjustment); anything else is fetched in
+    full.
     """
 
+    columns = tuple(columns)
     # Normalise and de-duplicate tickers while preserving user-provided order.
     tickers = [sym.strip() for sym in tickers or [] if sym and sym.strip()]
     ordered_unique: list[str] = list(dict.fromkeys(tickers))
     if not ordered_unique:
         return {}
 
+    use_cache = interval == "1d" and PARQUET_AVAILABLE
+    cached: dict[str, pd.DataFrame] = {}
+    if use_cache:
+        for symbol in ordered_unique:
+            if (history := _load_cached_history(symbol, lookback_days)) is not None:
+                cached[symbol] = history
+
+    # Cached tickers only need their latest bars; the rest get the full window.
+    jobs = [
+        (batch, days)
+        for symbols, days in (
+            ([sym for sym in ordered_unique if sym not in cached], lookback_days),
+            (list(cached), INCREMENTAL_DAYS),
+        )
+        for batch in chunk_list(symbols, chunk_size)
+    ]
+    results = _download_jobs(jobs, interval)
+
+    if use_cache:
+        # Yahoo rescales past bars after a split or dividend.  A top-up that
+        # disagrees with the cache on the dates both hold means the cached
+        # history is on the old scale, so those tickers are fetched in full.
+        rescaled = [
+            sym for sym in cached if sym in results and not _bars_agree(cached[sym], results[sym])
+        ]
+        for symbol in rescaled:
+            del cached[symbol], results[symbol]
+        results.update(
+            _download_jobs([(batch, lookback_days) for batch in chunk_list(rescaled, chunk_size)], interval)
+        )
+
+        for symbol, df in results.items():
+            if symbol in cached:
+                df = results[symbol] = _merge_history(cached[symbol], df, lookback_days)
+                # Re-fetching bars the cache already holds (e.g. refreshing
+                # today's session) is not worth a rewrite; new dates are.
+                if df.index.equals(cached[symbol].index):
+                    continue
+            _store_cached_history(symbol, lookback_days, df)
+        # A failed top-up still leaves the cached bars usable.
+        for symbol in cached.keys() - results.keys():
+            results[symbol] = cached[symbol]
+
+    selected = {}
+    for symbol in ordered_unique:
+        if symbol in results:
+            df = _select_columns(results[symbol], columns).dropna(how="all")
+            if not df.empty:
+                selected[symbol] = df
+    return selected
+
+
+def _download_jobs(jobs: list[tuple[list[str], int]], interval: str) -> dict[str, pd.DataFrame]:
+    """Run ``(batch, lookback_days)`` downloads concurrently and merge the results."""
+
     results: dict[str, pd.DataFrame] = {}
-    for batch in chunk_list(ordered_unique, chunk_size):
-        try:
-            data = yf.download(
-                batch,
-                period=f"{lookback_days}d",
-                interval=interval,
-                group_by="ticker",
-                auto_adjust=False,
-                threads=False,
-                progress=False,
-            )
-        except Exception as exc:  # pragma: no cover - yfinance/network variations
-            LOGGER.warning("Failed downloading batch %s: %s", batch, exc)
-            continue
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as ex:
+        batches = ex.map(
+            lambda job: _download_batch(job[0], lookback_days=job[1], interval=interval),
+            jobs,
+        )
+        for batch_results in batches:
+            results.update(batch_results)
+    return results
 
-        if data.empty:
-            continue
 
-        if isinstance(data.columns, pd.MultiIndex):
-            for symbol in batch:
-                try:
-                    df = data.xs(symbol, axis=1, level=0)
-                except KeyError:
-                    continue
-                df = df.dropna(how="all")
-                if not df.empty:
-                    results[symbol] = df
-        else:
-            symbol = batch[0]
-            df = data.dropna(how="all")
+def _history_path(symbol: str, lookback_days: int) -> Path:
+    return PRICE_CACHE_DIR / f"{symbol}_{lookback_days}d.parquet"
+
+
+def _days_since(ts: pd.Timestamp) -> int:
+    return (pd.Timestamp.now(tz=ts.tz).normalize() - ts.normalize()).days
+
+
+def _load_cached_history(symbol: str, lookback_days: int) -> pd.DataFrame | None:
+    """The cached daily history of ``symbol``, if recent enough to top up."""
+
+    path = _history_path(symbol, lookback_days)
+    if not path.exists():
+        return None
+    try:
+        df = pd.read_parquet(path)
+    except Exception as exc:  # corrupt or half-written file: refetch in full
+        LOGGER.warning("Ignoring unreadable cache %s: %s", path, exc)
+        return None
+    if df.empty or _days_since(df.index[-1]) > INCREMENTAL_DAYS:
+        return None
+    return df
+
+
+def _bars_agree(cached: pd.DataFrame, recent: pd.DataFrame) -> bool:
+    """Whether ``recent`` repeats the cached prices on the dates both hold.
+
+    Each frame's latest bar may be a session still in progress and is left
+    out; with no other shared date the cache cannot be checked, so it is not
+    trusted.
+    """
+
+    shared = cached.index[:-1].intersection(recent.index[:-1])
+    if shared.empty:
+        return False
+    prices = [col for col in PRICE_COLUMNS if col != "Volume" and col in cached and col in recent]
+    return np.allclose(
+        cached.loc[shared, prices].to_numpy(dtype=np.float64),
+        recent.loc[shared, prices].to_numpy(dtype=np.float64),
+        rtol=1e-6,
+        equal_nan=True,
+    )
+
+
+def _merge_history(cached: pd.DataFrame, recent: pd.DataFrame, lookback_days: int) -> pd.DataFrame:
+    """Overlay ``recent`` bars on ``cached`` and trim to the lookback window."""
+
+    merged = pd.concat([cached, recent])
+    merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+    cutoff = pd.Timestamp.now(tz=merged.index.tz).normalize() - pd.Timedelta(days=lookback_days)
+    return merged[merged.index >= cutoff]
+
+
+def _store_cached_history(symbol: str, lookback_days: int, df: pd.DataFrame) -> None:
+    path = _history_path(symbol, lookback_days)
+    tmp = None
+    try:
+        PRICE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # A temp name unique to this writer, so the app and the screener
+        # cannot clobber each other's half-written file before the rename.
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as fh:
+            tmp = Path(fh.name)
+            df.to_parquet(fh, compression="zstd")
+        tmp.replace(path)
+    except Exception as exc:  # pragma: no cover - read-only home, full disk, ...
+        LOGGER.warning("Could not cache %s: %s", path, exc)
+        if tmp is not None:
+            tmp.unlink(missing_ok=True)
+
+
+def _download_batch(batch: list[str], *, lookback_days: int, interval: str) -> dict[str, pd.DataFrame]:
+    """Download one batch of tickers and split it into per-symbol frames."""
+
+    try:
+        data = yf.download(
+            batch,
+            period=f"{lookback_days}d",
+            interval=interval,
+            group_by="ticker",
+            auto_adjust=False,
+            threads=True,
+            progress=False,
+            session=YF_SESSION,
+        )
+    except Exception as exc:  # pragma: no cover - yfinance/network variations
+        LOGGER.warning("Failed downloading batch %s: %s", batch, exc)
+        return {}
+
+    results: dict[str, pd.DataFrame] = {}
+    if data.empty:
+        return results
+
+    if isinstance(data.columns, pd.MultiIndex):
+        # Group column positions by ticker in one pass over the MultiIndex,
+        # then gather each ticker straight from the shared ndarray instead of
+        # an ``xs`` plus a pandas ``dropna`` per symbol.
+        positions = pd.RangeIndex(data.shape[1]).groupby(data.columns.get_level_values(0))
+        fields = data.columns.get_level_values(1)
+        values = data.to_numpy(dtype=np.float64)
+        for symbol in batch:
+            if symbol not in positions:
+                continue
+            block = values[:, positions[symbol]]
+            keep = ~np.isnan(block).all(axis=1)
+            df = pd.DataFrame(block[keep], index=data.index[keep], columns=fields[positions[symbol]])
             if not df.empty:
                 results[symbol] = df
+    else:
+        symbol = batch[0]
+        df = data.dropna(how="all")
+        if not df.empty:
+            results[symbol] = df
 
     return results
 
 
+def _select_columns(df: pd.DataFrame, columns: tuple[str, ...]) -> pd.DataFrame:
+    return df[[col for col in columns if col in df.columns]]
+
+
+def _fresh_mask_numpy(highs: np.ndarray, last_close: np.ndarray, tolerance: float) -> np.ndarray:
+    """Vectorised fresh-high test over a right-aligned ``(T, N)`` highs panel."""
+
+    prior_high = np.nanmax(highs[:-1], axis=0)
+    return (highs[-1] > prior_high * (1 + tolerance)) & (last_close >= prior_high * (1 - tolerance))
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def _fresh_mask(highs, last_close, tolerance):
+        """Numba version of :func:`_fresh_mask_numpy`: one pass per column, in parallel."""
+
+        rows, cols = highs.shape
+        out = np.zeros(cols, np.bool_)
+        for j in prange(cols):
+            prior_high = -np.inf
+            for i in range(rows - 1):
+                value = highs[i, j]
+                if value > prior_high:  # NaN padding never compares greater
+                    prior_high = value
+            out[j] = (
+                prior_high > -np.inf
+                and highs[rows - 1, j] > prior_high * (1 + tolerance)
+                and last_close[j] >= prior_high * (1 - tolerance)
+            )
+        return out
+
+else:
+    _fresh_mask = _fresh_mask_numpy
+
+
 def get_fresh_52week(
     price_history: Mapping[str, pd.DataFrame],
     *,
@@ -187,35 +727,40 @@ def get_fresh_52week(
     fade before the session ends.
     """
 
-    fresh: list[str] = []
+    # Right-align every ticker's last ``lookback`` valid bars on its own latest
+    # bar, then evaluate the whole universe as one (lookback, N) panel.
+    symbols: list[str] = []
+    windows: list[np.ndarray] = []
     for symbol, df in price_history.items():
         if df is None or df.empty:
             continue
         if "High" not in df.columns or "Close" not in df.columns:
             continue
 
-        cleaned = df.sort_index().dropna(subset=["High", "Close"])
-        if len(cleaned) < 2:
-            continue
-
-        window = cleaned.iloc[-lookback:]
+        # yfinance already returns bars in date order, so only sort when needed.
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
+        window = df[["High", "Close"]].dropna().iloc[-lookback:]
         if len(window) < 2:
             continue
 
-        prior_high = window["High"].iloc[:-1].max()
-        if pd.isna(prior_high):
-            continue
+        symbols.append(symbol)
+        windows.append(window.to_numpy(dtype=np.float64))
 
-        latest = window.iloc[-1]
-        last_high = latest["High"]
-        last_close = latest["Close"]
-        if pd.isna(last_high) or pd.isna(last_close):
-            continue
+    if not symbols:
+        return []
 
-        if last_high > prior_high * (1 + tolerance) and last_close >= prior_high * (1 - tolerance):
-            fresh.append(symbol)
+    # Fill a preallocated buffer bottom-up instead of aligning a union index
+    # with ``pd.concat``: the last row is each ticker's latest bar, shorter
+    # histories are NaN-padded at the top.
+    highs = np.full((max(len(w) for w in windows), len(symbols)), np.nan)
+    last_close = np.empty(len(symbols))
+    for j, window in enumerate(windows):
+        highs[-len(window):, j] = window[:, 0]
+        last_close[j] = window[-1, 1]
 
-    return sorted(dict.fromkeys(fresh))
+    fresh = _fresh_mask(highs, last_close, tolerance)
+    return sorted(symbol for symbol, hit in zip(symbols, fresh) if hit)
 
 
 def chunk_list(lst: list[str], size: int):